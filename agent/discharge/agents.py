@@ -118,7 +118,7 @@ from livekit.plugins import deepgram, openai, silero
 from livekit.plugins import noise_cancellation
 
 from .config import LIVEKIT_AGENT_NAME, GMAIL_USERNAME, GMAIL_APP_PASSWORD, SUMMARY_EMAIL_RECIPIENT
-from shared import send_instruction_summary_email
+from shared import send_instruction_summary_email_async
 from shared.redis_database import get_database, close_database, close_database_sync
 from shared.diagnostics import get_diagnostic_info
 
@@ -960,7 +960,7 @@ Give me one moment while I send the instruction summary.
         
         # Send the email
         patient_language = getattr(ctx.userdata, 'patient_language', 'English')
-        success, message = send_instruction_summary_email(
+        success, message = await send_instruction_summary_email_async(
             instructions=instructions,
             patient_name=patient_name,
             session_id=session_id,
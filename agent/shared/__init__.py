@@ -4,15 +4,39 @@ Shared utilities package for PostOp AI system
 Contains shared utilities used by multiple workflows:
 - email_service: Email functionality for sending summaries
 - database: PostgreSQL storage for sessions and transcripts
+
+Submodules are imported on first attribute access, so importing one
+utility doesn't pull in the dependencies of the others (e.g. asyncpg).
 """
+import importlib
+
+# Public name -> submodule that defines it
+_LAZY_IMPORTS = {
+    'send_instruction_summary_email': '.email_service',
+    'send_instruction_summary_email_async': '.email_service',
+    'get_database': '.database',
+    'close_database': '.database',
+    'close_database_sync': '.database',
+    'SessionDatabase': '.database',
+}
+
+
+def __getattr__(name):
+    """Import the owning submodule the first time a public name is accessed"""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value  # Cache so later lookups skip __getattr__
+    return value
 
-from .email_service import send_instruction_summary_email
-from .database import get_database, close_database, close_database_sync, SessionDatabase
 
 __all__ = [
     'send_instruction_summary_email',
+    'send_instruction_summary_email_async',
     'get_database',
     'close_database',
     'close_database_sync',
     'SessionDatabase'
-]
\ No newline at end of file
+]
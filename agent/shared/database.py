@@ -15,6 +15,16 @@ from asyncpg import Pool, Connection
 logger = logging.getLogger("postop-agent")
 
 
+async def _init_connection(conn: Connection):
+    """Register a JSONB codec so Python lists/dicts bind and decode directly"""
+    await conn.set_type_codec(
+        'jsonb',
+        encoder=json.dumps,
+        decoder=json.loads,
+        schema='pg_catalog'
+    )
+
+
 class SessionDatabase:
     """Handles PostgreSQL storage for PostOp AI sessions"""
 
@@ -39,7 +49,8 @@ class SessionDatabase:
                 self.database_url,
                 min_size=1,
                 max_size=10,
-                command_timeout=60
+                command_timeout=60,
+                init=_init_connection
             )
 
             # Create tables if they don't exist
@@ -148,11 +159,11 @@ class SessionDatabase:
                     timestamp,
                     patient_name,
                     patient_language,
-                    json.dumps(transcript),
-                    json.dumps(collected_instructions),
+                    transcript,
+                    collected_instructions,
                     is_evaluation,
                     source_session_id,
-                    json.dumps(evaluation_metadata)
+                    evaluation_metadata
                 )
 
             logger.info(f"[DATABASE] Saved session {session_id}")
@@ -190,13 +201,13 @@ class SessionDatabase:
                     "timestamp": row["timestamp"],
                     "patient_name": row["patient_name"],
                     "patient_language": row["patient_language"],
-                    "transcript": json.loads(row["transcript"]) if row["transcript"] else [],
-                    "collected_instructions": json.loads(row["collected_instructions"]) if row["collected_instructions"] else [],
+                    "transcript": row["transcript"] or [],
+                    "collected_instructions": row["collected_instructions"] or [],
                     "created_at": row["created_at"],
                     "updated_at": row["updated_at"],
                     "is_evaluation": row["is_evaluation"],
                     "source_session_id": row["source_session_id"],
-                    "evaluation_metadata": json.loads(row["evaluation_metadata"]) if row["evaluation_metadata"] else {}
+                    "evaluation_metadata": row["evaluation_metadata"] or {}
                 }
             return None
 
@@ -6,21 +6,57 @@ Provides runtime diagnostic information about the system and database.
 
 import socket
 import shutil
+import time
 import psutil
 import asyncio
-from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple, Callable, Awaitable
 
 from .database import get_database
 
+# Session counts gathered in one scan instead of four separate queries
+_DATABASE_STATS_QUERY = """
+SELECT
+    COUNT(*) AS total_sessions,
+    COUNT(*) FILTER (WHERE session_id LIKE 'eval_%' OR is_evaluation = true) AS evaluation_sessions,
+    COUNT(*) FILTER (WHERE jsonb_array_length(transcript) > 0) AS sessions_with_messages,
+    COUNT(*) FILTER (WHERE created_at > NOW() - INTERVAL '24 hours') AS recent_sessions_24h
+FROM sessions
+"""
+
+_BYTE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
 
 class SystemDiagnostics:
     """Collects and provides system diagnostic information"""
 
     def __init__(self):
         self._cached_info = {}
-        self._last_update = None
+        self._updated_at: Dict[str, float] = {}  # item -> monotonic time of last refresh
         self._cache_duration = 60  # seconds
+        self._refresh_lock = asyncio.Lock()  # Only one coroutine refreshes at a time
+
+        # Host facts that don't change for the life of the process
+        self._hostname = socket.gethostname()
+        self._local_ip = self._get_local_ip()
+        self._cpu_count = psutil.cpu_count()
+        self._cpu_count_logical = psutil.cpu_count(logical=True)
+        self._boot_time = psutil.boot_time()
+        self._cached_info['hostname'] = self._hostname
+        self._cached_info['ip'] = self._local_ip
+
+        # Prime the CPU sampler so later non-blocking reads have a baseline
+        psutil.cpu_percent(interval=None)
+
+        # Refreshable items: item -> (ttl seconds, provider). Blocking system
+        # probes run in worker threads so the event loop is never held up.
+        self._providers: Dict[str, Tuple[float, Callable[[], Awaitable[Any]]]] = {
+            'disk_space': (self._cache_duration, lambda: asyncio.to_thread(self._get_disk_space)),
+            'memory': (self._cache_duration, lambda: asyncio.to_thread(self._get_memory_info)),
+            'cpu': (self._cache_duration, lambda: asyncio.to_thread(self._get_cpu_info)),
+            'uptime': (self._cache_duration, lambda: asyncio.to_thread(self._get_uptime)),
+            'load_average': (self._cache_duration, lambda: asyncio.to_thread(self._get_load_average)),
+            'database_stats': (self._cache_duration, self._get_database_stats),
+        }
 
     async def get_info(self, requested_items: Optional[list] = None) -> Dict[str, Any]:
         """
@@ -31,12 +67,12 @@ class SystemDiagnostics:
                            Options: 'hostname', 'ip', 'disk_space', 'memory', 'cpu',
                                    'database_stats', 'uptime', 'load_average'
         """
-        # Update cache if needed
-        await self._update_cache_if_needed()
-
         if requested_items is None:
             requested_items = ['hostname', 'ip', 'database_stats']
 
+        # Only refresh requested items that are missing or expired
+        await self._refresh_stale_items(requested_items)
+
         result = {}
         for item in requested_items:
             if item in self._cached_info:
@@ -44,32 +80,39 @@ class SystemDiagnostics:
 
         return result
 
-    async def _update_cache_if_needed(self):
-        """Update cache if it's stale or empty"""
-        now = datetime.now()
-        if (self._last_update is None or
-            (now - self._last_update).total_seconds() > self._cache_duration):
-            await self._update_cache()
-            self._last_update = now
-
-    async def _update_cache(self):
-        """Update all diagnostic information in cache"""
-        try:
-            # System information
-            self._cached_info['hostname'] = socket.gethostname()
-            self._cached_info['ip'] = self._get_local_ip()
-            self._cached_info['disk_space'] = self._get_disk_space()
-            self._cached_info['memory'] = self._get_memory_info()
-            self._cached_info['cpu'] = self._get_cpu_info()
-            self._cached_info['uptime'] = self._get_uptime()
-            self._cached_info['load_average'] = self._get_load_average()
-
-            # Database information (async)
-            self._cached_info['database_stats'] = await self._get_database_stats()
-
-        except Exception as e:
-            # If any individual metric fails, log but continue
-            print(f"Warning: Failed to update some diagnostic info: {e}")
+    def _is_stale(self, item: str) -> bool:
+        """Check whether a refreshable item is missing or older than its TTL"""
+        provider = self._providers.get(item)
+        if provider is None:
+            return False  # Static or unknown item
+
+        updated_at = self._updated_at.get(item)
+        return updated_at is None or time.monotonic() - updated_at > provider[0]
+
+    async def _refresh_stale_items(self, items: list):
+        """Refresh the stale items among those requested"""
+        if not any(self._is_stale(item) for item in items):
+            return
+
+        async with self._refresh_lock:
+            # Re-check: another coroutine may have refreshed while we waited
+            stale = [item for item in dict.fromkeys(items) if self._is_stale(item)]
+            if not stale:
+                return
+
+            results = await asyncio.gather(
+                *(self._providers[item][1]() for item in stale),
+                return_exceptions=True
+            )
+
+            now = time.monotonic()
+            for item, value in zip(stale, results):
+                if isinstance(value, Exception):
+                    # If any individual metric fails, log but continue
+                    print(f"Warning: Failed to update diagnostic info '{item}': {value}")
+                    continue
+                self._cached_info[item] = value
+                self._updated_at[item] = now
 
     def _get_local_ip(self) -> str:
         """Get the local IP address"""
@@ -111,9 +154,10 @@ class SystemDiagnostics:
         """Get CPU usage information"""
         try:
             return {
-                'usage_percent': f"{psutil.cpu_percent(interval=1):.1f}%",
-                'count': psutil.cpu_count(),
-                'count_logical': psutil.cpu_count(logical=True)
+                # Usage since the previous sample; never blocks the event loop
+                'usage_percent': f"{psutil.cpu_percent(interval=None):.1f}%",
+                'count': self._cpu_count,
+                'count_logical': self._cpu_count_logical
             }
         except Exception:
             return {'error': 'Unable to get CPU info'}
@@ -121,8 +165,7 @@ class SystemDiagnostics:
     def _get_uptime(self) -> str:
         """Get system uptime"""
         try:
-            import time
-            uptime_seconds = time.time() - psutil.boot_time()
+            uptime_seconds = time.time() - self._boot_time
             days = int(uptime_seconds // 86400)
             hours = int((uptime_seconds % 86400) // 3600)
             minutes = int((uptime_seconds % 3600) // 60)
@@ -149,39 +192,18 @@ class SystemDiagnostics:
             db = await asyncio.wait_for(get_database(), timeout=5.0)
 
             async with db.pool.acquire() as conn:
-                # Get total conversation count with timeout
-                total_sessions = await asyncio.wait_for(
-                    conn.fetchval("SELECT COUNT(*) FROM sessions"), timeout=3.0
+                # Collect all counts in a single round-trip with timeout
+                row = await asyncio.wait_for(
+                    conn.fetchrow(_DATABASE_STATS_QUERY), timeout=3.0
                 )
 
-                # Get evaluation session count with timeout
-                eval_sessions = await asyncio.wait_for(
-                    conn.fetchval(
-                        "SELECT COUNT(*) FROM sessions WHERE session_id LIKE 'eval_%' OR is_evaluation = true"
-                    ), timeout=3.0
-                )
-
-                # Get sessions with conversations with timeout
-                sessions_with_messages = await asyncio.wait_for(
-                    conn.fetchval("SELECT COUNT(*) FROM sessions WHERE jsonb_array_length(transcript) > 0"),
-                    timeout=3.0
-                )
-
-                # Get recent session count (last 24 hours) with timeout
-                recent_sessions = await asyncio.wait_for(
-                    conn.fetchval(
-                        """SELECT COUNT(*) FROM sessions
-                           WHERE created_at > NOW() - INTERVAL '24 hours'"""
-                    ), timeout=3.0
-                )
-
-                return {
-                    'total_sessions': total_sessions,
-                    'evaluation_sessions': eval_sessions,
-                    'sessions_with_messages': sessions_with_messages,
-                    'recent_sessions_24h': recent_sessions,
-                    'organic_sessions': total_sessions - eval_sessions
-                }
+            return {
+                'total_sessions': row['total_sessions'],
+                'evaluation_sessions': row['evaluation_sessions'],
+                'sessions_with_messages': row['sessions_with_messages'],
+                'recent_sessions_24h': row['recent_sessions_24h'],
+                'organic_sessions': row['total_sessions'] - row['evaluation_sessions']
+            }
 
         except asyncio.TimeoutError:
             return {'error': 'Database query timed out'}
@@ -190,11 +212,9 @@ class SystemDiagnostics:
 
     def _format_bytes(self, bytes_value: int) -> str:
         """Format bytes into human readable string"""
-        for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-            if bytes_value < 1024.0:
-                return f"{bytes_value:.1f} {unit}"
-            bytes_value /= 1024.0
-        return f"{bytes_value:.1f} PB"
+        # Each unit spans 10 bits, so the bit length picks the unit directly
+        idx = min(max(int(bytes_value).bit_length() - 1, 0) // 10, len(_BYTE_UNITS) - 1)
+        return f"{bytes_value / (1 << (10 * idx)):.1f} {_BYTE_UNITS[idx]}"
 
 
 # Global instance
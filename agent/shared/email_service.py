@@ -4,57 +4,420 @@ Email service for sending instruction summaries via Gmail SMTP
 This module provides functionality to send discharge instruction summaries
 as SMS-formatted emails using Gmail's SMTP server with app password authentication.
 """
-import smtplib
+import socket
 import logging
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
+import asyncio
+import functools
+import json
+import html
+import threading
+import atexit
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Iterator, Tuple, Any, TYPE_CHECKING
 import os
 
+# smtplib (and the ssl/email machinery behind it) and email.mime are imported
+# where messages are built and sent, so formatting-only callers skip them
+if TYPE_CHECKING:
+    import smtplib
+
 logger = logging.getLogger("postop-agent")
 
+# Carrier email-to-SMS gateways; these only deliver the plain-text body
+_SMS_GATEWAY_DOMAINS = frozenset({
+    "vtext.com",                 # Verizon
+    "vzwpix.com",                # Verizon (MMS)
+    "txt.att.net",               # AT&T
+    "mms.att.net",               # AT&T (MMS)
+    "tmomail.net",               # T-Mobile
+    "messaging.sprintpcs.com",   # Sprint
+    "pm.sprint.com",             # Sprint (MMS)
+    "msg.fi.google.com",         # Google Fi
+    "sms.myboostmobile.com",     # Boost Mobile
+    "mymetropcs.com",            # Metro by T-Mobile
+    "email.uscc.net",            # US Cellular
+    "vmobl.com",                 # Virgin Mobile
+})
+
+# Dedicated threads for blocking SMTP sends, so agent event loops never wait on
+# the network and other default-executor work can't starve email delivery
+_EMAIL_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="email-sender")
+
+# Authenticated SMTP sessions kept open between sends, keyed by
+# (smtp_server, smtp_port, username) -> (connection, connected_at, messages_sent).
+# A session is checked out exclusively while in use and returned afterwards.
+_SMTP_POOL: Dict[Tuple[str, int, str], Tuple['smtplib.SMTP', float, int]] = {}
+_SMTP_POOL_LOCK = threading.Lock()
+_SMTP_MAX_SESSION_AGE_SECONDS = 100
+_SMTP_MAX_MESSAGES_PER_SESSION = 100  # Gmail caps messages per session
+
+# Bound blocking socket calls so a half-open connection fails in seconds, and
+# let TCP keepalive detect dead peers on idle pooled sessions
+_SMTP_TIMEOUT_SECONDS = 10
+_SMTP_KEEPALIVE_OPTIONS = (
+    ("TCP_KEEPIDLE", 30),
+    ("TCP_KEEPINTVL", 10),
+    ("TCP_KEEPCNT", 3),
+)
+
+
+def _close_smtp(server: 'smtplib.SMTP'):
+    """Close an SMTP session, ignoring errors from already-dead connections"""
+    try:
+        server.quit()
+    except Exception:
+        try:
+            server.close()
+        except Exception:
+            pass
+
+
+def _enable_keepalive(sock: socket.socket):
+    """Turn on TCP keepalive, with tighter probe timings where the platform allows"""
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+    for option_name, value in _SMTP_KEEPALIVE_OPTIONS:
+        option = getattr(socket, option_name, None)
+        if option is not None:
+            sock.setsockopt(socket.IPPROTO_TCP, option, value)
+
+
+def _smtp_is_alive(server: 'smtplib.SMTP') -> bool:
+    """Health-check a pooled SMTP session with NOOP"""
+    try:
+        return server.noop()[0] == 250
+    except Exception:
+        return False
+
 
-def _translate_text_with_openai(text: str, target_language: str) -> Optional[str]:
+@contextmanager
+def _pooled_smtp(
+    smtp_server: str,
+    smtp_port: int,
+    username: str,
+    password: str
+) -> Iterator['smtplib.SMTP']:
     """
-    Translate text to target language using OpenAI API
+    Check out an authenticated SMTP session, reusing a pooled one when healthy
+
+    The session is returned to the pool on success and closed if the caller
+    raises, so a broken connection is never reused.
+    """
+    import smtplib
+    
+    key = (smtp_server, smtp_port, username)
+
+    with _SMTP_POOL_LOCK:
+        entry = _SMTP_POOL.pop(key, None)
+
+    server = None
+    if entry is not None:
+        server, connected_at, messages_sent = entry
+        expired = (time.monotonic() - connected_at > _SMTP_MAX_SESSION_AGE_SECONDS or
+                   messages_sent >= _SMTP_MAX_MESSAGES_PER_SESSION)
+        if expired or not _smtp_is_alive(server):
+            _close_smtp(server)
+            server = None
+
+    if server is None:
+        logger.debug("[EMAIL] Connecting to %s:%s", smtp_server, smtp_port)
+        server = smtplib.SMTP(smtp_server, smtp_port, timeout=_SMTP_TIMEOUT_SECONDS)
+        try:
+            _enable_keepalive(server.sock)
+            server.starttls()  # Enable TLS encryption
+            server.login(username, password)  # Authenticate with app password
+        except Exception:
+            _close_smtp(server)
+            raise
+        connected_at = time.monotonic()
+        messages_sent = 0
+
+    try:
+        yield server
+    except Exception:
+        _close_smtp(server)
+        raise
+
+    with _SMTP_POOL_LOCK:
+        if key not in _SMTP_POOL:
+            _SMTP_POOL[key] = (server, connected_at, messages_sent + 1)
+            server = None
+
+    if server is not None:
+        # Another session for this account was returned first
+        _close_smtp(server)
+
+
+@atexit.register
+def _close_smtp_pool():
+    """Close all pooled SMTP sessions at interpreter exit"""
+    with _SMTP_POOL_LOCK:
+        entries = list(_SMTP_POOL.values())
+        _SMTP_POOL.clear()
+
+    for server, _, _ in entries:
+        _close_smtp(server)
+
+
+_openai_client = None
+_async_openai_client = None
+_openai_client_lock = threading.Lock()
+
+
+def _get_openai_client():
+    """Get or create the shared OpenAI client (reuses its HTTP connection pool)"""
+    global _openai_client
+
+    if _openai_client is None:
+        with _openai_client_lock:
+            if _openai_client is None:
+                import openai
+                _openai_client = openai.OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+
+    return _openai_client
+
+
+def _get_async_openai_client():
+    """Get or create the shared async OpenAI client"""
+    global _async_openai_client
+
+    if _async_openai_client is None:
+        import openai
+        _async_openai_client = openai.AsyncOpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+
+    return _async_openai_client
+
+
+_TRANSLATOR_SYSTEM = {
+    "role": "system",
+    "content": "You are a medical translator specializing in discharge instructions. Translate accurately while using patient-friendly language."
+}
+
+_TRANSLATOR_PROMPT_TMPL = """Translate the values of the following JSON object from English to {lang}. 
+    Each value is part of a medical discharge summary. Maintain medical accuracy and use patient-friendly language. Keep the same format and structure.
+    Return a JSON object with exactly the same keys and the translated text as values:
+
+    {text}"""
+
+# Completion budget per translated segment. Fixed and generous: translations into
+# e.g. Russian or Hindi take several times the tokens of the English text, and a
+# truncated json_object response can't be parsed.
+_TRANSLATION_MAX_TOKENS_PER_SEGMENT = 2000
+
+
+def _translation_request(segments: Dict[str, str], target_language: str) -> Dict[str, Any]:
+    """Build the chat completion arguments for translating segments"""
+    text = json.dumps(segments, ensure_ascii=False)
+    
+    return {
+        "model": "gpt-4o-mini",
+        "messages": [
+            _TRANSLATOR_SYSTEM,
+            {"role": "user", "content": _TRANSLATOR_PROMPT_TMPL.format(lang=target_language, text=text)}
+        ],
+        "response_format": {"type": "json_object"},
+        "max_tokens": _TRANSLATION_MAX_TOKENS_PER_SEGMENT * len(segments),
+        "temperature": 0.1
+    }
+
+
+def _translation_truncated(response) -> bool:
+    """Check whether a completion stopped because it ran out of tokens"""
+    return bool(response.choices) and response.choices[0].finish_reason == "length"
+
+
+def _parse_translation_response(segments: Dict[str, str], response) -> Dict[str, str]:
+    """Extract translated segments from a completion, raising if any are missing"""
+    if not (response.choices and response.choices[0].message and response.choices[0].message.content):
+        raise ValueError("OpenAI returned no translation")
+    if _translation_truncated(response):
+        raise ValueError("OpenAI translation was cut off at max_tokens")
+    
+    translated = json.loads(response.choices[0].message.content)
+    result = {}
+    for name in segments:
+        value = translated.get(name)
+        if not isinstance(value, str) or not value.strip():
+            raise ValueError(f"OpenAI translation missing segment '{name}'")
+        result[name] = value.strip()
+    
+    return result
+
+
+def _translation_error(e: Exception) -> None:
+    """Log a failed translation; callers fall back to English"""
+    logger.error("OpenAI translation error: %s", e)
+    return None
+
+
+def _needs_segment_retry(segments: Dict[str, str], response) -> bool:
+    """Check whether a multi-segment completion was truncated and should be split up"""
+    if len(segments) > 1 and _translation_truncated(response):
+        logger.warning("OpenAI translation truncated; translating %d segments separately", len(segments))
+        return True
+    return False
+
+
+def _merge_segment_results(
+    segments: Dict[str, str],
+    results: List[Optional[Dict[str, str]]]
+) -> Dict[str, str]:
+    """Combine per-segment retries, keeping English for any segment that still failed"""
+    return {
+        name: single[name] if single else text
+        for (name, text), single in zip(segments.items(), results)
+    }
+
+
+def _translation_result(segments: Dict[str, str], response) -> Optional[Dict[str, str]]:
+    """Parse a completion into translated segments, or None if it's unusable"""
+    try:
+        return _parse_translation_response(segments, response)
+    except Exception as e:
+        return _translation_error(e)
+
+
+def _translate_segments(segments: Dict[str, str], target_language: str) -> Optional[Dict[str, str]]:
+    """
+    Translate several named pieces of text to target language in one OpenAI call
+    
+    If the combined completion is cut off at max_tokens, each segment is
+    retried on its own and any segment that still fails stays in English.
     
     Args:
-        text: English text to translate
+        segments: Mapping of segment name to English text (e.g. subject, body)
         target_language: Target language (e.g., 'Spanish', 'French')
         
     Returns:
-        Translated text or None if translation fails
+        Mapping of the same names to translated text, or None if translation fails
     """
     try:
-        import openai
-        
-        # Initialize OpenAI client
-        client = openai.OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
-        
-        prompt = f"""Translate the following medical discharge summary from English to {target_language}. 
-        Maintain medical accuracy and use patient-friendly language. Keep the same format and structure:
+        response = _get_openai_client().chat.completions.create(
+            **_translation_request(segments, target_language)
+        )
+    except Exception as e:
+        return _translation_error(e)
+    
+    if _needs_segment_retry(segments, response):
+        return _merge_segment_results(segments, [
+            _translate_segments({name: text}, target_language)
+            for name, text in segments.items()
+        ])
+    
+    return _translation_result(segments, response)
 
-        {text}"""
-        
-        response = client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[
-                {"role": "system", "content": "You are a medical translator specializing in discharge instructions. Translate accurately while using patient-friendly language."},
-                {"role": "user", "content": prompt}
-            ],
-            max_tokens=1000,
-            temperature=0.1
+
+async def _translate_segments_async(segments: Dict[str, str], target_language: str) -> Optional[Dict[str, str]]:
+    """Async variant of _translate_segments that awaits the OpenAI requests"""
+    try:
+        response = await _get_async_openai_client().chat.completions.create(
+            **_translation_request(segments, target_language)
         )
-        
-        if response.choices and response.choices[0].message:
-            return response.choices[0].message.content.strip()
-        
-        return None
-        
     except Exception as e:
-        logger.error(f"OpenAI translation error: {e}")
-        return None
+        return _translation_error(e)
+    
+    if _needs_segment_retry(segments, response):
+        return _merge_segment_results(segments, await asyncio.gather(*(
+            _translate_segments_async({name: text}, target_language)
+            for name, text in segments.items()
+        )))
+    
+    return _translation_result(segments, response)
+
+
+def _instruction_text(instruction) -> str:
+    """Extract stripped text from an instruction dict or plain value"""
+    if isinstance(instruction, dict):
+        return instruction.get("text", "").strip()
+    return str(instruction).strip()
+
+
+# English email bodies; %-formatted with (patient name, provider name[, instruction list])
+_NO_INSTRUCTIONS_BODY = """Hi %s,
+
+Great to meet you earlier today. As promised, here's your discharge summary from your conversation with %s's office.
+
+No specific discharge instructions were captured during this session.
+
+If you have any questions, don't hesitate to call or text me anytime. I'm here 24/7 to make your recovery process as smooth as possible!
+
+Best,
+Maya"""
+
+_INSTRUCTIONS_BODY = """Hi %s,
+
+Great to meet you earlier today. As promised, here's your discharge summary from your conversation with %s's office.
+
+%s
+
+If you have any questions, don't hesitate to call or text me anytime. I'm here 24/7 to make your recovery process as smooth as possible!
+
+Best,
+Maya"""
+
+
+def _format_email_body(
+    instructions: List[Dict],
+    patient_display_name: str,
+    provider_name: str
+) -> str:
+    """Build the English email body"""
+    if not instructions:
+        return _NO_INSTRUCTIONS_BODY % (patient_display_name, provider_name)
+    
+    # Build instruction list (numbering keeps the original positions)
+    instructions_text = "\n".join(
+        f"    {idx}. {text}"
+        for idx, text in enumerate(map(_instruction_text, instructions), 1)
+        if text
+    )
+    
+    return _INSTRUCTIONS_BODY % (patient_display_name, provider_name, instructions_text)
+
+
+def _format_english_email_content(
+    instructions: List[Dict],
+    patient_name: Optional[str] = None,
+    healthcare_provider_name: Optional[str] = None
+) -> tuple[str, str]:
+    """Build the English subject line and email body"""
+    
+    # Full month name and day without leading zero (e.g. "March 5")
+    month_day = datetime.now().strftime("%B %d").replace(" 0", " ")
+    
+    provider_name = healthcare_provider_name or "your doctor"
+    patient_display_name = patient_name or "Patient"
+    
+    # Create subject line
+    subject_line = f"Maya from {provider_name}'s Office | Your Discharge Summary from {month_day}"
+    
+    # Create email body
+    email_body = _format_email_body(instructions, patient_display_name, provider_name)
+    
+    return subject_line, email_body
+
+
+def _needs_translation(patient_language: Optional[str]) -> bool:
+    """Check whether the summary should be translated from English"""
+    return bool(patient_language) and patient_language.lower() != 'english'
+
+
+def _email_segments(subject_line: str, email_body: str) -> Dict[str, str]:
+    """Name the parts of an email for translation"""
+    return {"subject": subject_line, "body": email_body}
+
+
+def _apply_translation(
+    subject_line: str,
+    email_body: str,
+    translated: Optional[Dict[str, str]]
+) -> tuple[str, str]:
+    """Use the translated subject and body, or keep English if translation failed"""
+    if translated:
+        return translated["subject"], translated["body"]
+    return subject_line, email_body
 
 
 def format_email_content(
@@ -77,76 +440,154 @@ def format_email_content(
     Returns:
         Tuple of (subject_line, email_body)
     """
+    subject_line, email_body = _format_english_email_content(
+        instructions, patient_name, healthcare_provider_name
+    )
     
-    # Get current date components
-    now = datetime.now()
-    month = now.strftime("%B")  # Full month name (January, February, etc.)
-    day = now.strftime("%d").lstrip('0')  # Day without leading zero
+    # Translate if needed (subject line and email body together in one request)
+    if _needs_translation(patient_language):
+        translated = _translate_segments(
+            _email_segments(subject_line, email_body), patient_language
+        )
+        subject_line, email_body = _apply_translation(subject_line, email_body, translated)
     
-    provider_name = healthcare_provider_name or "your doctor"
-    patient_display_name = patient_name or "Patient"
+    return subject_line, email_body
+
+
+async def format_email_content_async(
+    instructions: List[Dict], 
+    patient_name: Optional[str] = None,
+    session_id: Optional[str] = None,
+    patient_language: Optional[str] = None,
+    healthcare_provider_name: Optional[str] = None
+) -> tuple[str, str]:
+    """
+    Async variant of format_email_content
     
-    # Determine if translation is needed
-    needs_translation = patient_language and patient_language.lower() != 'english'
+    Translation awaits the async OpenAI client instead of blocking the event loop.
+    Arguments and return value match format_email_content.
+    """
+    subject_line, email_body = _format_english_email_content(
+        instructions, patient_name, healthcare_provider_name
+    )
     
-    # Create subject line
-    subject_line = f"Maya from {provider_name}'s Office | Your Discharge Summary from {month} {day}"
+    # Translate if needed (subject line and email body together in one request)
+    if _needs_translation(patient_language):
+        translated = await _translate_segments_async(
+            _email_segments(subject_line, email_body), patient_language
+        )
+        subject_line, email_body = _apply_translation(subject_line, email_body, translated)
     
-    # Create email body
-    if not instructions or len(instructions) == 0:
-        email_body = f"""Hi {patient_display_name},
+    return subject_line, email_body
 
-Great to meet you earlier today. As promised, here's your discharge summary from your conversation with {provider_name}'s office.
 
-No specific discharge instructions were captured during this session.
+def _check_email_config(
+    gmail_username: Optional[str],
+    gmail_app_password: Optional[str],
+    recipient_email: Optional[str]
+) -> Optional[str]:
+    """Return an error message if required email configuration is missing"""
+    if not gmail_username or not gmail_app_password or not recipient_email:
+        error_msg = "Missing required email configuration (username, app_password, or recipient)"
+        logger.error("[EMAIL] %s", error_msg)
+        return error_msg
+    return None
 
-If you have any questions, don't hesitate to call or text me anytime. I'm here 24/7 to make your recovery process as smooth as possible!
 
-Best,
-Maya"""
-    else:
-        # Build instruction list
-        instruction_lines = []
-        for idx, instruction in enumerate(instructions, 1):
-            if isinstance(instruction, dict):
-                text = instruction.get("text", "").strip()
-            else:
-                text = str(instruction).strip()
-                
-            if text:
-                instruction_lines.append(f"    {idx}. {text}")
-        
-        instructions_text = "\n".join(instruction_lines)
-        
-        email_body = f"""Hi {patient_display_name},
+def _is_sms_gateway(recipient_email: str) -> bool:
+    """Check whether the recipient is a carrier email-to-SMS gateway address"""
+    return recipient_email.rpartition("@")[2].lower() in _SMS_GATEWAY_DOMAINS
 
-Great to meet you earlier today. As promised, here's your discharge summary from your conversation with {provider_name}'s office.
 
-{instructions_text}
+def _build_email_message(
+    subject_line: str,
+    email_body: str,
+    sender: str,
+    recipient_email: str
+):
+    """Build the outgoing message (plain-text only for SMS gateways)"""
+    from email.message import EmailMessage
+    from email.mime.text import MIMEText
+    from email.mime.multipart import MIMEMultipart
+    
+    if _is_sms_gateway(recipient_email):
+        # SMS gateways discard HTML, so send a single plain-text message
+        msg = EmailMessage()
+        msg['Subject'] = subject_line
+        msg['From'] = sender
+        msg['To'] = recipient_email
+        msg.set_content(email_body)
+        return msg
+    
+    # Create email message
+    msg = MIMEMultipart('alternative')
+    msg['Subject'] = subject_line
+    msg['From'] = sender
+    msg['To'] = recipient_email
+    
+    # Create plain text version
+    text_part = MIMEText(email_body, 'plain')
+    msg.attach(text_part)
+    
+    # Create HTML version with proper formatting
+    html_body = "<br>".join(html.escape(line) for line in email_body.split('\n'))
+    html_part = MIMEText(f"<div style='font-family: Arial, sans-serif; font-size: 14px; line-height: 1.5;'>{html_body}</div>", 'html')
+    msg.attach(html_part)
+    return msg
 
-If you have any questions, don't hesitate to call or text me anytime. I'm here 24/7 to make your recovery process as smooth as possible!
 
-Best,
-Maya"""
+def _describe_send_error(e: Exception) -> str:
+    """Turn a delivery exception into the error message returned to callers"""
+    import smtplib
     
-    # Translate if needed
-    if needs_translation:
-        try:
-            # Translate subject line
-            translated_subject = _translate_text_with_openai(subject_line, patient_language)
-            if translated_subject:
-                subject_line = translated_subject
-            
-            # Translate email body
-            translated_body = _translate_text_with_openai(email_body, patient_language)
-            if translated_body:
-                email_body = translated_body
-                
-        except Exception as e:
-            logger.error(f"Translation failed: {e}")
-            # Continue with English version if translation fails
+    if isinstance(e, smtplib.SMTPAuthenticationError):
+        return f"Gmail authentication failed - check app password: {str(e)}"
+    if isinstance(e, smtplib.SMTPException):
+        return f"SMTP error occurred: {str(e)}"
+    return f"Unexpected error sending email: {str(e)}"
+
+
+def _send_email_message(
+    subject_line: str,
+    email_body: str,
+    session_id: Optional[str],
+    gmail_username: str,
+    gmail_app_password: str,
+    recipient_email: str,
+    smtp_server: str,
+    smtp_port: int
+) -> tuple[bool, str]:
+    """
+    Build the MIME message and deliver it over SMTP (blocking)
     
-    return subject_line, email_body
+    Returns:
+        Tuple of (success: bool, message: str)
+    """
+    import smtplib
+    
+    try:
+        msg = _build_email_message(subject_line, email_body, gmail_username, recipient_email)
+        
+        # Send over a pooled Gmail SMTP session (connects and authenticates if needed)
+        for attempt in range(2):
+            try:
+                with _pooled_smtp(smtp_server, smtp_port, gmail_username, gmail_app_password) as server:
+                    server.send_message(msg)
+                break
+            except smtplib.SMTPServerDisconnected:
+                # The dead session was evicted; reconnect once
+                if attempt:
+                    raise
+                logger.warning("[EMAIL] Session: %s | SMTP server disconnected, reconnecting", session_id)
+        
+    except Exception as e:
+        error_msg = _describe_send_error(e)
+        logger.error("[EMAIL] Session: %s | %s", session_id, error_msg)
+        return False, error_msg
+    
+    success_msg = f"Email sent successfully to {recipient_email}"
+    logger.info("[EMAIL] Session: %s | %s", session_id, success_msg)
+    return True, success_msg
 
 
 def send_instruction_summary_email(
@@ -181,9 +622,8 @@ def send_instruction_summary_email(
     """
     
     # Validate required parameters
-    if not gmail_username or not gmail_app_password or not recipient_email:
-        error_msg = "Missing required email configuration (username, app_password, or recipient)"
-        logger.error(f"[EMAIL] {error_msg}")
+    error_msg = _check_email_config(gmail_username, gmail_app_password, recipient_email)
+    if error_msg:
         return False, error_msg
     
     try:
@@ -196,52 +636,80 @@ def send_instruction_summary_email(
             healthcare_provider_name
         )
         
-        # Create email message
-        msg = MIMEMultipart('alternative')
-        msg['Subject'] = subject_line
-        msg['From'] = gmail_username
-        msg['To'] = recipient_email
-        
-        # Create plain text version
-        text_part = MIMEText(email_body, 'plain')
-        msg.attach(text_part)
-        
-        # Create HTML version with proper formatting
-        html_body = email_body.replace('\n', '<br>')
-        html_part = MIMEText(f"<div style='font-family: Arial, sans-serif; font-size: 14px; line-height: 1.5;'>{html_body}</div>", 'html')
-        msg.attach(html_part)
-        
-        # Connect to Gmail SMTP server
-        logger.debug(f"[EMAIL] Connecting to {smtp_server}:{smtp_port}")
-        server = smtplib.SMTP(smtp_server, smtp_port)
-        server.starttls()  # Enable TLS encryption
-        
-        # Authenticate with app password
-        server.login(gmail_username, gmail_app_password)
-        
-        # Send the email
-        text = msg.as_string()
-        server.sendmail(gmail_username, recipient_email, text)
-        server.quit()
-        
-        success_msg = f"Email sent successfully to {recipient_email}"
-        logger.info(f"[EMAIL] Session: {session_id} | {success_msg}")
-        return True, success_msg
-        
-    except smtplib.SMTPAuthenticationError as e:
-        error_msg = f"Gmail authentication failed - check app password: {str(e)}"
-        logger.error(f"[EMAIL] Session: {session_id} | {error_msg}")
+    except Exception as e:
+        error_msg = f"Unexpected error sending email: {str(e)}"
+        logger.error("[EMAIL] Session: %s | %s", session_id, error_msg)
         return False, error_msg
-        
-    except smtplib.SMTPException as e:
-        error_msg = f"SMTP error occurred: {str(e)}"
-        logger.error(f"[EMAIL] Session: {session_id} | {error_msg}")
+    
+    return _send_email_message(
+        subject_line,
+        email_body,
+        session_id,
+        gmail_username,
+        gmail_app_password,
+        recipient_email,
+        smtp_server,
+        smtp_port
+    )
+
+
+async def send_instruction_summary_email_async(
+    instructions: List[Dict],
+    patient_name: Optional[str] = None,
+    session_id: Optional[str] = None,
+    gmail_username: Optional[str] = None,
+    gmail_app_password: Optional[str] = None,
+    recipient_email: Optional[str] = None,
+    patient_language: Optional[str] = None,
+    healthcare_provider_name: Optional[str] = None,
+    smtp_server: str = "smtp.gmail.com",
+    smtp_port: int = 587
+) -> tuple[bool, str]:
+    """
+    Send instruction summary without blocking the running event loop
+    
+    Translation awaits the async OpenAI client and the SMTP send runs on a
+    dedicated email thread pool. Arguments match send_instruction_summary_email.
+    
+    Returns:
+        Tuple of (success: bool, message: str)
+    """
+    
+    # Validate required parameters
+    error_msg = _check_email_config(gmail_username, gmail_app_password, recipient_email)
+    if error_msg:
         return False, error_msg
+    
+    try:
+        # Format the email content
+        subject_line, email_body = await format_email_content_async(
+            instructions, 
+            patient_name, 
+            session_id, 
+            patient_language, 
+            healthcare_provider_name
+        )
         
     except Exception as e:
         error_msg = f"Unexpected error sending email: {str(e)}"
-        logger.error(f"[EMAIL] Session: {session_id} | {error_msg}")
+        logger.error("[EMAIL] Session: %s | %s", session_id, error_msg)
         return False, error_msg
+    
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _EMAIL_EXECUTOR,
+        functools.partial(
+            _send_email_message,
+            subject_line,
+            email_body,
+            session_id,
+            gmail_username,
+            gmail_app_password,
+            recipient_email,
+            smtp_server,
+            smtp_port
+        )
+    )
 
 
 def test_email_configuration(
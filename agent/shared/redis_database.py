@@ -163,10 +163,11 @@ class SessionRedisDatabase:
             async for key in self.client.scan_iter(match="session:*"):
                 keys.append(key)
 
-            # Get all session data
+            # Get all session data in a single round-trip
+            values = await self.client.mget(keys) if keys else []
+
             sessions = []
-            for key in keys:
-                data = await self.client.get(key)
+            for key, data in zip(keys, values):
                 if data and data.strip():  # Check that data is not empty
                     try:
                         session_data = json.loads(data)